@@ -1,102 +1,400 @@
 import random
 from tkinter import *
 import colors as c
+import concurrent.futures
+import heapq
 import itertools
-import collections
-import _thread
+import os
+import threading
 import time
-import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional - without it the heuristic functions below simply
+    # run as plain Python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+# Goal state coordinates for every tile, precomputed once so manhattan
+# is a plain dict lookup instead of a numpy scan per tile
+#     1 2 3
+#     8 0 4
+#     7 6 5
+GOAL_POS = {1: (0, 0), 2: (0, 1), 3: (0, 2),
+            8: (1, 0), 0: (1, 1), 4: (1, 2),
+            7: (2, 0), 6: (2, 1), 5: (2, 2)}
+
+# The goal state as a flat tuple, for direct board comparisons
+GOAL_BOARD = (1, 2, 3,
+              8, 0, 4,
+              7, 6, 5)
+
+def _build_moves() -> dict:
+    # Builds the legal-move table for every position of the blank: maps the
+    # blank's flat index to (swap_index, action) pairs, where action names the
+    # direction the neighboring tile slides (into the blank). Deriving the 24
+    # entries from the four offsets once at import beats both hand-maintaining
+    # the table and re-running bounds checks per expansion
+    moves = {}
+    for zero in range(9):
+        zero_i, zero_j = divmod(zero, 3)
+        entries = []
+        for action, (di, dj) in (('R', (0, -1)), ('L', (0, 1)),
+                                 ('D', (-1, 0)), ('U', (1, 0))):
+            i, j = zero_i + di, zero_j + dj
+            if 0 <= i < 3 and 0 <= j < 3:
+                entries.append((i * 3 + j, action))
+        moves[zero] = entries
+    return moves
+
+
+MOVES = _build_moves()
+
+
+# Goal row and column for each tile value (index = tile), as flat tuples the
+# jitted functions below can index without any dict machinery
+GOAL_ROW = tuple(GOAL_POS[value][0] for value in range(9))
+GOAL_COL = tuple(GOAL_POS[value][1] for value in range(9))
+
+
+@njit(cache=True)
+def manhattan_fn(board) -> int:
+    # Sum of each tile's distance from its goal position, written with plain
+    # integer loops over the board tuple so numba can compile it to machine code
+    distance = 0
+    for index in range(9):
+        value = board[index]
+        if value != 0:
+            distance += abs(GOAL_ROW[value] - index // 3) + abs(GOAL_COL[value] - index % 3)
+    return distance
+
+
+@njit(cache=True)
+def linear_conflict_fn(board) -> int:
+    # Counts how many tiles must temporarily leave a row/column to resolve
+    # its conflicts. For each line, count reversed pairs among tiles already
+    # in their goal line; on a 3-wide line (inversions + 1) // 2 equals the
+    # number of tiles a greedy removal takes out, which keeps the count
+    # admissible (a tile never pays for two conflicts at once)
+    removed = 0
+    for line in range(3):
+        inversions = 0
+        for a in range(3):
+            value_a = board[line * 3 + a]
+            if value_a == 0 or GOAL_ROW[value_a] != line:
+                continue
+            for b in range(a + 1, 3):
+                value_b = board[line * 3 + b]
+                if value_b != 0 and GOAL_ROW[value_b] == line and GOAL_COL[value_a] > GOAL_COL[value_b]:
+                    inversions += 1
+        removed += (inversions + 1) // 2
+        inversions = 0
+        for a in range(3):
+            value_a = board[a * 3 + line]
+            if value_a == 0 or GOAL_COL[value_a] != line:
+                continue
+            for b in range(a + 1, 3):
+                value_b = board[b * 3 + line]
+                if value_b != 0 and GOAL_COL[value_b] == line and GOAL_ROW[value_a] > GOAL_ROW[value_b]:
+                    inversions += 1
+        removed += (inversions + 1) // 2
+    return removed
+
+
+# Move tables in kernel-friendly form: per blank position, the neighbor
+# indices padded to four entries with -1, plus how many are real
+MOVE_SWAPS = tuple(tuple([swap for swap, _ in MOVES[zero]] + [-1] * (4 - len(MOVES[zero])))
+                   for zero in range(9))
+MOVE_COUNT = tuple(len(MOVES[zero]) for zero in range(9))
+
+
+@njit(cache=True)
+def pack_fn(board) -> int:
+    # Packs the 9-tile board into one integer, 4 bits per position, so the
+    # search kernel can swap tiles with a couple of XORs and hash states as
+    # a single machine word
+    packed = 0
+    for index in range(9):
+        packed |= board[index] << (4 * index)
+    return packed
+
+
+@njit(cache=True)
+def linear_conflict_packed(packed: int) -> int:
+    # Packed-board twin of linear_conflict_fn, reading tiles out of the
+    # nibbles instead of a tuple
+    removed = 0
+    for line in range(3):
+        inversions = 0
+        for a in range(3):
+            value_a = (packed >> (4 * (line * 3 + a))) & 15
+            if value_a == 0 or GOAL_ROW[value_a] != line:
+                continue
+            for b in range(a + 1, 3):
+                value_b = (packed >> (4 * (line * 3 + b))) & 15
+                if value_b != 0 and GOAL_ROW[value_b] == line and GOAL_COL[value_a] > GOAL_COL[value_b]:
+                    inversions += 1
+        removed += (inversions + 1) // 2
+        inversions = 0
+        for a in range(3):
+            value_a = (packed >> (4 * (a * 3 + line))) & 15
+            if value_a == 0 or GOAL_COL[value_a] != line:
+                continue
+            for b in range(a + 1, 3):
+                value_b = (packed >> (4 * (b * 3 + line))) & 15
+                if value_b != 0 and GOAL_COL[value_b] == line and GOAL_ROW[value_a] > GOAL_ROW[value_b]:
+                    inversions += 1
+        removed += (inversions + 1) // 2
+    return removed
+
+
+@njit(cache=True)
+def ida_star_kernel(packed: int, zero: int, manhattan: int) -> list:
+    # IDA* over packed boards: the whole search loop compiles to machine code
+    # with no Python objects in sight. Explicit parallel stacks replace
+    # recursion; manhattan is maintained incrementally per move and linear
+    # conflicts are recounted per child, exactly like the object solvers.
+    # Returns the blank's position after each move of an optimal solution,
+    # or [-1] if none exists within the give-up bound
+    bound = manhattan + 2 * linear_conflict_packed(packed)
+    while bound <= 80:
+        # One depth-first probe under the current f bound
+        boards = [0] * 88
+        zeros = [0] * 88
+        manhattans = [0] * 88
+        move_index = [0] * 88
+        came_from = [0] * 88
+        trail = [0] * 88
+        boards[0] = packed
+        zeros[0] = zero
+        manhattans[0] = manhattan
+        came_from[0] = -1
+        depth = 0
+        next_bound = -1
+        while depth >= 0:
+            z = zeros[depth]
+            index = move_index[depth]
+            if index >= MOVE_COUNT[z]:
+                # All moves tried at this depth - back up
+                depth -= 1
+                continue
+            move_index[depth] += 1
+            swap = MOVE_SWAPS[z][index]
+            if swap == came_from[depth]:
+                # Skip the move that just undoes how we got here
+                continue
+            board = boards[depth]
+            tile = (board >> (4 * swap)) & 15
+            child = board ^ (tile << (4 * swap)) ^ (tile << (4 * z))
+            delta = (abs(GOAL_ROW[tile] - z // 3) + abs(GOAL_COL[tile] - z % 3)
+                     - abs(GOAL_ROW[tile] - swap // 3) - abs(GOAL_COL[tile] - swap % 3))
+            child_manhattan = manhattans[depth] + delta
+            if child_manhattan == 0:
+                # Every tile home means solved - emit the trail of blank moves
+                trail[depth + 1] = swap
+                result = [0] * (depth + 1)
+                for k in range(depth + 1):
+                    result[k] = trail[k + 1]
+                return result
+            f = depth + 1 + child_manhattan + 2 * linear_conflict_packed(child)
+            if f > bound:
+                if next_bound == -1 or f < next_bound:
+                    next_bound = f
+                continue
+            depth += 1
+            boards[depth] = child
+            zeros[depth] = swap
+            manhattans[depth] = child_manhattan
+            move_index[depth] = 0
+            came_from[depth] = z
+            trail[depth] = swap
+        if next_bound == -1:
+            break
+        bound = next_bound
+    return [-1]
+
+
+@njit(cache=True)
+def lehmer_rank(board) -> int:
+    # Perfect hash for the pattern database: ranks the board among all 9!
+    # orderings by counting, for each position, how many later tiles are
+    # smaller - so every permutation gets a unique index in 0..362879
+    rank = 0
+    for i in range(9):
+        smaller = 0
+        for j in range(i + 1, 9):
+            if board[j] < board[i]:
+                smaller += 1
+        rank = rank * (9 - i) + smaller
+    return rank
+
+
+# The full 8-puzzle pattern database: one byte per permutation holding its
+# true distance to the goal (255 = unreachable parity class). Built lazily by
+# load_pattern_db and persisted next to the module, since the backward BFS
+# over all 181,440 reachable states only ever needs to run once
+PATTERN_DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pattern.db')
+PATTERN_DB_SIZE = 362880
+_pattern_db = None
+
+
+def _build_pattern_db() -> bytearray:
+    # Backward BFS from the goal labels every reachable state with its true
+    # distance; the moves are their own inverses, so distances from the goal
+    # equal distances to it
+    distances = bytearray([255]) * PATTERN_DB_SIZE
+    distances[lehmer_rank(GOAL_BOARD)] = 0
+    frontier = [GOAL_BOARD]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for board in frontier:
+            zero = board.index(0)
+            for swap, action in MOVES[zero]:
+                child = list(board)
+                child[zero], child[swap] = child[swap], child[zero]
+                child = tuple(child)
+                rank = lehmer_rank(child)
+                if distances[rank] == 255:
+                    distances[rank] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+def is_solvable(board: tuple) -> bool:
+    # Parity test: a slide move is one transposition (flipping the tile
+    # permutation's parity) and moves the blank one step (flipping the parity
+    # of its distance from home), so the XOR of the two parities is invariant
+    # and zero at the goal. Lets solvers reject the unreachable half of the
+    # state space without searching it
+    goal_index = {value: index for index, value in enumerate(GOAL_BOARD)}
+    sequence = [goal_index[value] for value in board]
+    inversions = 0
+    for i in range(9):
+        for j in range(i + 1, 9):
+            if sequence[i] > sequence[j]:
+                inversions += 1
+    zero_i, zero_j = divmod(board.index(0), 3)
+    home_i, home_j = GOAL_POS[0]
+    blank_distance = abs(zero_i - home_i) + abs(zero_j - home_j)
+    return inversions % 2 == blank_distance % 2
+
+
+def load_pattern_db() -> bytes:
+    # Returns the pattern database, building and saving it on first ever use
+    global _pattern_db
+    if _pattern_db is None:
+        try:
+            with open(PATTERN_DB_FILE, 'rb') as db_file:
+                _pattern_db = db_file.read()
+        except OSError:
+            _pattern_db = bytes(_build_pattern_db())
+            with open(PATTERN_DB_FILE, 'wb') as db_file:
+                db_file.write(_pattern_db)
+        if len(_pattern_db) != PATTERN_DB_SIZE:
+            # Stale or truncated file - rebuild rather than misread it
+            _pattern_db = bytes(_build_pattern_db())
+            with open(PATTERN_DB_FILE, 'wb') as db_file:
+                db_file.write(_pattern_db)
+    return _pattern_db
+
+
+# Pay the one-off numba compile cost at import time instead of mid-solve
+manhattan_fn(GOAL_BOARD)
+linear_conflict_fn(GOAL_BOARD)
+lehmer_rank(GOAL_BOARD)
+ida_star_kernel(pack_fn((1, 2, 3, 8, 4, 0, 7, 6, 5)), 5, 1)
 
 
 class Puzzle:
     # A class representing an '8-puzzle'.
-    def __init__(self, board: list) -> None:
-        self.width = len(board[0])
+    # The board is a flat, immutable tuple of 9 ints (row-major), so
+    # puzzles hash/compare for free and moves never need a deep copy.
+    # __slots__ because the searches allocate tens of thousands of these -
+    # skipping the per-instance __dict__ roughly halves their footprint
+    __slots__ = ('board', 'packed')
+
+    def __init__(self, board: tuple) -> None:
         # Input Starting Node
         self.board = board
-        # Initializing a Global Goal State
-        self.goal_state = np.array([
-            [1, 2, 3],
-            [8, 0, 4],
-            [7, 6, 5]])
+        # Packed-int form of the board - one machine word that the solvers
+        # hash and compare instead of building a 9-character string per state
+        self.packed = pack_fn(board)
 
     @property
     def solved(self) -> bool:
-        # Solution is found if the flattened matrix are equal to 123804765
-        return str(self) == '123804765'
+        # Solution is found if the board matches the goal tuple
+        return self.board == GOAL_BOARD
 
     @property
     def actions(self) -> list:
-        # Returns a list of move/action sequences. Move results in the child node where
-        # '0' is sliding in one of the possible directions
-        def create_move(at, to):
-            return lambda: self._move(at, to)
-
+        # Returns a list of (new_board, action, delta) triples, one per legal
+        # move of a tile into the blank, straight from the precomputed MOVES
+        # table. delta is how much the move changed the manhattan distance
+        # (+1 or -1), since only the one sliding tile moved
+        zero = self.board.index(0)
+        zero_i, zero_j = divmod(zero, 3)
         moves = []
-        for i, j in itertools.product(range(self.width), range(self.width)):
-            directions = {'R': (i, j - 1),
-                          'L': (i, j + 1),
-                          'D': (i - 1, j),
-                          'U': (i + 1, j)}
-
-            for action, (row, column) in directions.items():
-                if 0 <= row < self.width and 0 <= column < self.width and self.board[row][column] == 0:
-                    move = create_move((i, j), (row, column)), action
-                    moves.append(move)
+        for swap, action in MOVES[zero]:
+            board = list(self.board)
+            tile = board[swap]
+            board[zero], board[swap] = tile, 0
+            goal_i, goal_j = GOAL_POS[tile]
+            swap_i, swap_j = divmod(swap, 3)
+            delta = (abs(goal_i - zero_i) + abs(goal_j - zero_j)
+                     - abs(goal_i - swap_i) - abs(goal_j - swap_j))
+            moves.append((tuple(board), action, delta))
         return moves
 
     @property
     def manhattan(self) -> int:
         # Calculates the sum of distances of each
         # tiles current location from goal state location
-        distance = 0
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] != 0:
-                    # Get the coordinates for item at node[i][j] in goal state position
-                    goal_state_coordinate = np.where(self.goal_state == self.board[i][j])
-                    # Calculate the Manhattan distance of each point on the node (except 0)
-                    distance += abs(goal_state_coordinate[0][0] - i) + abs(goal_state_coordinate[1][0] - j)
-        return distance
-
-    def copy(self):
-        # Return a new puzzle with the same board as 'self'
-        board = []
-        for row in self.board:
-            board.append([x for x in row])
-        return Puzzle(board)
-
-    def _move(self, at: list, to: list) -> 'Puzzle':
-        # Return a new puzzle where 'at' and 'to' tiles have been swapped.
-        copy = self.copy()
-        i, j = at
-        r, c = to
-        copy.board[i][j], copy.board[r][c] = copy.board[r][c], copy.board[i][j]
-        return copy
+        return manhattan_fn(self.board)
 
-    def __str__(self) -> str:
-        return ''.join(map(str, self))
+    @property
+    def linear_conflict(self) -> int:
+        # Counts tiles that sit in their goal row (or column) but block each
+        # other by being in reversed order. Each counted tile costs at least
+        # two extra moves beyond manhattan, so manhattan + 2 * linear_conflict
+        # is a tighter heuristic that is still admissible
+        return linear_conflict_fn(self.board)
 
-    def __iter__(self):
-        for row in self.board:
-            yield from row
+    def __str__(self) -> str:
+        return ''.join(map(str, self.board))
 
 
 class Node:
+    # Allocated once per generated state, so like Puzzle it carries
+    # __slots__ instead of a __dict__
+    __slots__ = ('puzzle', 'parent', 'action', 'c', 'manhattan',
+                 'heuristic', 'final_score', 'state')
 
-    def __init__(self, puzzle: Puzzle, parent=None, action=None) -> None:
+    def __init__(self, puzzle: Puzzle, parent=None, action=None, delta=0) -> None:
         self.puzzle = puzzle  # - 'puzzle' is a Puzzle instance
         self.parent = parent  # - 'parent' is the preceding node generated by the solver, if any
         self.action = action  # - 'action' is the action taken to produce puzzle, if any
         if self.parent is not None:
             # c score is your path cost score
             self.c = parent.c + 1
+            # Only one tile moved, so nudge the parent's manhattan distance
+            # by the move's delta instead of re-scanning the whole board
+            self.manhattan = parent.manhattan + delta
         else:
             self.c = 0
-
-    @property
-    def state(self) -> str:
-        return str(self)  # Return a hashable representation of self
+            # Only the root pays for a full manhattan scan
+            self.manhattan = puzzle.manhattan
+        # h stands for your heuristic score. Linear conflicts can shift by
+        # more than one per move, so they are recounted for each node on top
+        # of the incrementally maintained manhattan distance
+        self.heuristic = self.manhattan + 2 * puzzle.linear_conflict
+        self.final_score = self.heuristic + self.c
+        self.state = puzzle.packed  # Hashable representation of self
 
     @property
     def path(self):
@@ -114,15 +412,6 @@ class Node:
     def actions(self) -> list:
         return self.puzzle.actions  # Wrapper for 'actions' accessible at current state
 
-    @property
-    def heuristic(self) -> int:
-        return self.puzzle.manhattan  # Return the manhattan distance of the node
-        # h stands for your heuristic score
-
-    @property
-    def final_score(self) -> int:
-        return self.heuristic + self.c
-
     def __str__(self) -> str:
         return str(self.puzzle)
 
@@ -136,61 +425,204 @@ class Solver:
 
     def solve_a_star(self) -> Node.path:
         # Perform A* search and return a path to the solution, if it exists
-        queue = collections.deque([Node(self.start)])
-        seen = set()
-        seen.add(queue[0].state)
+        root = Node(self.start)
+        # Counter breaks ties between nodes with equal scores so the
+        # heap never has to compare two Node objects directly
+        counter = itertools.count()
+        # Heap ordered by lowest cost of both Heuristic and Manhattan distance combined
+        queue = [(root.final_score, next(counter), root)]
+        # Cheapest path cost found so far per state. When a better route to an
+        # already-queued state turns up, a fresh entry is pushed and the stale
+        # one is skipped on pop - no rebuilds, and re-opens stay cheap
+        best_c = {root.state: 0}
         while queue:
-            # Sorts the queue based on Lowest cost of both Heuristic and Manhattan distance combine
-            queue = collections.deque(sorted(list(queue), key=lambda node: node.finalscore))
-            node = queue.popleft()
+            _, _, node = heapq.heappop(queue)
+            if node.c > best_c[node.state]:
+                # A cheaper route to this state was pushed after this entry
+                continue
             if node.solved:
                 return node.path
 
-            for move, action in node.actions:
-                child = Node(move(), node, action)
+            for new_board, action, delta in node.actions:
+                child = Node(Puzzle(new_board), node, action, delta)
 
-                if child.state not in seen:
-                    queue.appendleft(child)
-                    seen.add(child.state)
+                previous = best_c.get(child.state)
+                if previous is None or child.c < previous:
+                    best_c[child.state] = child.c
+                    heapq.heappush(queue, (child.final_score, next(counter), child))
 
     def solve_uniform_cost(self) -> Node.path:
         # Perform Uniform Cost search and return a path to the solution, if it exists
-        queue = collections.deque([Node(self.start)])
-        seen = set()
-        seen.add(queue[0].state)
+        root = Node(self.start)
+        counter = itertools.count()
+        # Heap ordered by Lowest cost(in this case, steps taken to reach node)
+        queue = [(root.c, next(counter), root)]
+        # Cheapest path cost found so far per state, with lazy deletion of
+        # stale heap entries as in solve_a_star
+        best_c = {root.state: 0}
         while queue:
-            # Sorts the queue based on Lowest cost(in this case, steps taken to reach node)
-            queue = collections.deque(sorted(list(queue), key=lambda node: node.c))
-            node = queue.popleft()
+            _, _, node = heapq.heappop(queue)
+            if node.c > best_c[node.state]:
+                continue
             if node.solved:
                 return node.path
 
-            for move, action in node.actions:
-                child = Node(move(), node, action)
+            for new_board, action, delta in node.actions:
+                child = Node(Puzzle(new_board), node, action, delta)
 
-                if child.state not in seen:
-                    queue.appendleft(child)
-                    seen.add(child.state)
+                previous = best_c.get(child.state)
+                if previous is None or child.c < previous:
+                    best_c[child.state] = child.c
+                    heapq.heappush(queue, (child.c, next(counter), child))
 
     def solve_best_first_search(self) -> Node.path:
         # Perform best first search and return a path to the solution, if it exists
-        queue = collections.deque([Node(self.start)])
+        root = Node(self.start)
+        counter = itertools.count()
+        # Heap ordered by the heuristic score of each node (in this case the manhattan distance)
+        queue = [(root.heuristic, next(counter), root)]
         seen = set()
-        seen.add(queue[0].state)
+        seen.add(root.state)
         while queue:
-            # Sorts the queue based on the heuristic score of each node (in this case the manhattan distance)
-            queue = collections.deque(sorted(list(queue), key=lambda node: node.heuristic))
-            node = queue.popleft()
+            _, _, node = heapq.heappop(queue)
             if node.solved:
                 return node.path
 
-            for move, action in node.actions:
-                child = Node(move(), node, action)
+            for new_board, action, delta in node.actions:
+                child = Node(Puzzle(new_board), node, action, delta)
 
                 if child.state not in seen:
-                    queue.appendleft(child)
+                    heapq.heappush(queue, (child.heuristic, next(counter), child))
                     seen.add(child.state)
 
+    def solve_ida_star(self) -> Node.path:
+        # Perform IDA* search and return a path to the solution, if it exists.
+        # Repeated depth-first probes under an increasing f bound find the same
+        # optimal path as A* while only keeping the current path in memory.
+        # The search itself runs inside ida_star_kernel on packed boards; this
+        # wrapper just replays the kernel's trail of blank moves as Puzzle/Node
+        # objects so callers still get the usual path of nodes
+        board = self.start.board
+        if not is_solvable(board):
+            # Without a seen set the kernel's probes would grow without bound
+            # on an unsolvable input, so rule that out by parity first
+            return None
+        root = Node(self.start)
+        if root.solved:
+            return root.path
+        trail = ida_star_kernel(pack_fn(board), board.index(0), root.manhattan)
+        if trail[0] < 0:
+            # The kernel exhausted its bound without a solution - unsolvable
+            return None
+        node = root
+        for blank in trail:
+            for new_board, action, delta in node.actions:
+                if new_board.index(0) == blank:
+                    node = Node(Puzzle(new_board), node, action, delta)
+                    break
+        return node.path
+
+    def solve_pattern_db(self) -> Node.path:
+        # Perform A* search guided by the pattern database, which stores the
+        # true distance to goal for every reachable state. With an exact
+        # heuristic the search expands little beyond the solution path itself
+        database = load_pattern_db()
+        if database[lehmer_rank(self.start.board)] == 255:
+            # The start lies in the unreachable parity class - unsolvable
+            return None
+        root = Node(self.start)
+        counter = itertools.count()
+        queue = [(database[lehmer_rank(self.start.board)], next(counter), root)]
+        # Cheapest path cost found so far per state, with lazy deletion of
+        # stale heap entries as in solve_a_star
+        best_c = {root.state: 0}
+        while queue:
+            _, _, node = heapq.heappop(queue)
+            if node.c > best_c[node.state]:
+                continue
+            if node.solved:
+                return node.path
+
+            for new_board, action, delta in node.actions:
+                child = Node(Puzzle(new_board), node, action, delta)
+
+                previous = best_c.get(child.state)
+                if previous is None or child.c < previous:
+                    best_c[child.state] = child.c
+                    score = child.c + database[lehmer_rank(new_board)]
+                    heapq.heappush(queue, (score, next(counter), child))
+
+    def solve_bidirectional(self) -> Node.path:
+        # Perform bidirectional search: expand from the start and from the
+        # goal simultaneously and stitch the two half-paths together where
+        # the frontiers meet. Every move is its own inverse here, so the
+        # backward search uses the same move table. Each half only has to
+        # reach about half the solution depth, which cuts the explored state
+        # count roughly to its square root
+        start_root = Node(self.start)
+        goal_root = Node(Puzzle(GOAL_BOARD))
+        if start_root.state == goal_root.state:
+            return start_root.path
+        counter = itertools.count()
+        fwd_queue = [(0, next(counter), start_root)]
+        bwd_queue = [(0, next(counter), goal_root)]
+        seen_fwd = {start_root.state: start_root}
+        seen_bwd = {goal_root.state: goal_root}
+
+        def stitch(forward_node, backward_node):
+            # Both arguments sit on the meeting board. Walk the backward
+            # chain (meeting point -> goal) forwards, re-deriving each move
+            # through actions so the stitched nodes stay consistent
+            node = forward_node
+            back = backward_node
+            while back.parent is not None:
+                target = back.parent.puzzle.board
+                for new_board, action, delta in node.actions:
+                    if new_board == target:
+                        node = Node(Puzzle(new_board), node, action, delta)
+                        break
+                back = back.parent
+            return node.path
+
+        while fwd_queue and bwd_queue:
+            # Expand whichever direction currently has the smaller frontier
+            if len(fwd_queue) <= len(bwd_queue):
+                queue, seen, other_seen, forward = fwd_queue, seen_fwd, seen_bwd, True
+            else:
+                queue, seen, other_seen, forward = bwd_queue, seen_bwd, seen_fwd, False
+            _, _, node = heapq.heappop(queue)
+            for new_board, action, delta in node.actions:
+                child = Node(Puzzle(new_board), node, action, delta)
+
+                if child.state in seen:
+                    continue
+                seen[child.state] = child
+                if child.state in other_seen:
+                    # The frontiers touched - join the two half-paths
+                    if forward:
+                        return stitch(child, other_seen[child.state])
+                    return stitch(other_seen[child.state], child)
+                heapq.heappush(queue, (child.c, next(counter), child))
+
+    @staticmethod
+    def solve_many(boards, workers: int = None) -> list:
+        # Solve a whole batch of boards in parallel, one interpreter per
+        # worker - the GIL rules out useful Python threading for the solve
+        # itself, so separate processes it is. Results come back in input
+        # order as lists of actions ('L'/'R'/'U'/'D'), or None where a board
+        # is unsolvable
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_solve_board, boards))
+
+
+def _solve_board(board: tuple) -> list:
+    # Worker for Solver.solve_many; lives at module level so the process
+    # pool can pickle it by name
+    path = Solver(Puzzle(board)).solve_ida_star()
+    if path is None:
+        return None
+    return [node.action for node in path if node.action is not None]
+
 
 class Game_Puzzle(Frame):
 
@@ -205,7 +637,6 @@ class Game_Puzzle(Frame):
         self.main_grid.grid(pady=(100, 0))
         # Method to fill the rest of the GUI and create control over widgets
         self.make_GUI()
-        self.matrix = []
         # Top Frame holds the matrix input along with start button
         top_frame = Frame(self)
         top_frame.place(relx=0.5, y=45, anchor='center')
@@ -221,7 +652,10 @@ class Game_Puzzle(Frame):
         algorithms = [
             ('Uniform Cost Search', 1),
             ('Best First Search', 2),
-            ('A* Search', 3)
+            ('A* Search', 3),
+            ('IDA* Search', 4),
+            ('Pattern DB Search', 5),
+            ('Bidirectional Search', 6)
         ]
         algorithm_selected = IntVar()
         algorithm_selected.set(3)
@@ -240,10 +674,13 @@ class Game_Puzzle(Frame):
             # In the format of '123456780' or some order there of
             input_str = str(self.matrix_input.get())
             algorithm_mode = algorithm_selected.get()
-            self.matrix.clear()  # clears the default matrix before inserting puzzle
             try:
-                # Creates a new thread to run the algorithm on as to not freeze the main thread
-                _thread.start_new_thread(self.run, (input_str, algorithm_mode))
+                # Creates a new thread to run the algorithm on as to not freeze
+                # the main thread; daemon so the interpreter can still exit
+                # cleanly if a solve is running when the window closes
+                threading.Thread(target=self.run,
+                                 args=(input_str, algorithm_mode),
+                                 daemon=True).start()
             finally:
                 print("Finished")
 
@@ -268,54 +705,57 @@ class Game_Puzzle(Frame):
     # Runs the algorithm against the matrix input
     def run(self, input_str: str, algo_mode: int) -> None:
         print('Running')
-        for index in range(len(input_str)):
-            if index % 3 == 0:
-                sub = input_str[index:index + 3]
-                lst = []
-                for j in sub:
-                    lst.append(j)
-                self.matrix.append(lst)
-
-        # Convert Matrix of Strings to Integers for conversion
-        for n, i in enumerate(self.matrix):
-            for k, j in enumerate(i):
-                self.matrix[n][k] = int(j)
-
-        puzzle = Puzzle(self.matrix)
+        # Convert the '123804765' style input into the flat board tuple
+        puzzle = Puzzle(tuple(int(digit) for digit in input_str))
         s = Solver(puzzle)
 
-        # Determines which algorithm to use based off radio button selection
+        # Determines which algorithm to use based off radio button selection.
+        # The dict holds the bound methods and only the selected one is
+        # called - building it from call results would run every solver
         def switch(case):
-            switcher = {1: s.solve_uniform_cost(),
-                        2: s.solve_best_first_search(),
-                        3: s.solve_a_star()}
-            return switcher.get(case)
+            switcher = {1: s.solve_uniform_cost,
+                        2: s.solve_best_first_search,
+                        3: s.solve_a_star,
+                        4: s.solve_ida_star,
+                        5: s.solve_pattern_db,
+                        6: s.solve_bidirectional}
+            return switcher[case]()
 
         # Toc - Tic will give the time that the computer takes
         # To find the solution path
         tic = time.perf_counter()
         p = switch(algo_mode)
         toc = time.perf_counter()
-        steps = -1
-        self.results_label.configure(text="TIME: " + str(toc - tic) + "\nSTEPS: " + str(steps))
-        # Loops through the nodes in the path and changes the GUI display matrix to show each step taken
-        for node in p:
-            for row in range(3):
-                for col in range(3):
-                    if node.puzzle.board[row][col] == 0:
-                        self.cells[row][col]['number'].configure(
-                            text=str('  '),
-                            font=c.CELL_NUMBER_FONTS)
-                    else:
-                        self.cells[row][col]['number'].configure(
-                            text=str(node.puzzle.board[row][col]),
-                            font=c.CELL_NUMBER_FONTS)
-            steps += 1
-            self.results_label.configure(text="TIME: " + str(toc - tic) + "\nSTEPS: " + str(steps))
-            self.update_idletasks()
-            # One second thread sleep to allow time for us to visually observe the puzzle being solved.
-            time.sleep(1)
-        self.update_idletasks()
-
-
-Game_Puzzle()
+        # Hand the finished path over to Tk's own scheduler and let the worker
+        # thread exit - the displayed time is pure solve time, and the event
+        # loop stays responsive while the steps play back
+        path = list(p) if p is not None else []
+        self.after_idle(self._show_step, path, 0, toc - tic)
+
+    def _show_step(self, path, index: int, solve_time: float) -> None:
+        # Draws one node of the solution path, then schedules the next one a
+        # second later so the puzzle can be visually observed being solved
+        # without ever blocking the Tk event loop
+        if index >= len(path):
+            return
+        node = path[index]
+        for row in range(3):
+            for col in range(3):
+                value = node.puzzle.board[row * 3 + col]
+                if value == 0:
+                    self.cells[row][col]['number'].configure(
+                        text=str('  '),
+                        font=c.CELL_NUMBER_FONTS)
+                else:
+                    self.cells[row][col]['number'].configure(
+                        text=str(value),
+                        font=c.CELL_NUMBER_FONTS)
+        self.results_label.configure(text="TIME: " + str(solve_time) + "\nSTEPS: " + str(index))
+        if index + 1 < len(path):
+            self.after(1000, self._show_step, path, index + 1, solve_time)
+
+
+if __name__ == '__main__':
+    # Guarded so the worker processes solve_many spawns (which re-import
+    # this module) don't each open their own window
+    Game_Puzzle()